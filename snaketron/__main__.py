@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 
     from back.agents import AbstractAISnakeAgent
     from back.events import EventSender
+    from back.type_hints import Position
 
 """
 TODO:
@@ -59,6 +60,13 @@ def define_opponents(
                 agent.add_opponent(opponent)
 
 
+def vertical_init_pos(x: int, y_head: int, length: int) -> list[Position]:
+    """Returns the cells, from the head to the tail, of a vertical snake of
+    `length` cells whose head is at (x, y_head) and whose tail points upward.
+    """
+    return [(x, y) for y in range(y_head, y_head - length, -1)]
+
+
 def build_game(
     event_sender: EventSender,
     height: int,
@@ -80,10 +88,13 @@ def build_game(
     x_left = dx
     x_right = width - dx - 1
 
-    blue_init_pos = [(x_left, y) for y in range(init_length-1+dy, -1+dy, -1)]
-    yellow_init_pos = [(x_right, y) for y in range(init_length-1+dy, -1+dy, -1)]
-    purple_init_pos = [(x_left, y) for y in range(height-1-dy, height-1-init_length-dy, -1)]
-    green_init_pos = [(x_right, y) for y in range(height-1-dy, height-1-init_length-dy, -1)]
+    y_top = init_length - 1 + dy
+    y_bottom = height - 1 - dy
+
+    blue_init_pos = vertical_init_pos(x_left, y_top, init_length)
+    yellow_init_pos = vertical_init_pos(x_right, y_top, init_length)
+    purple_init_pos = vertical_init_pos(x_left, y_bottom, init_length)
+    green_init_pos = vertical_init_pos(x_right, y_bottom, init_length)
 
     blue_init_dir = DOWN
     yellow_init_dir = DOWN
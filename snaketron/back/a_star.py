@@ -6,14 +6,19 @@ import numpy as np
 from back.direction import opposite_dir
 
 if TYPE_CHECKING:
-    from back.type_hints import Path, Position
+    from back.type_hints import Direction, Path, Position
     from back.world import AbstractGridGraph, AbstractHeuristic
 
 
 NO_PATH_FOUND = (None, None)
 
 
-def _get_path(graph: AbstractGridGraph, src: Position, dst: Position, parents: np.ndarray) -> Path:
+def _get_path(
+    graph: AbstractGridGraph,
+    src: Position,
+    dst: Position,
+    parents: dict[Position, Direction]
+) -> Path:
     x_src, y_src = src
     x_dst, y_dst = dst
     path_x = []
@@ -58,7 +63,7 @@ def shortest_path(
     heuristic: AbstractHeuristic,
     max_iteraton: int=-1
 ) -> Path:
-    parents = np.empty((graph.get_width(), graph.get_height(), 2), dtype=np.int32)
+    parents: dict[Position, Direction] = {}
     dist_from_src = np.full((graph.get_width(), graph.get_height()), np.inf, dtype=np.float64)
 
     current = src
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 
+import numpy as np
 from back.agents.abstract_snake_agent import AbstractSnakeAgent
 from back.a_star import shortest_path
 
@@ -25,8 +26,9 @@ class AbstractAISnakeAgent(AbstractSnakeAgent):
         super().__init__(world, initial_pos, alive)
 
         self.initial_dir = initial_dir
-        self.x_path: list[int] = []
-        self.y_path: list[int] = []
+        # positions of the followed path, from its destination to its first
+        # step, of which the first len(dir_path) are not reached yet
+        self.path = np.empty((0, 2), dtype=np.int16)
         self.dir_path: list[Direction] = []
         self.dir = self.initial_dir
 
@@ -34,8 +36,6 @@ class AbstractAISnakeAgent(AbstractSnakeAgent):
 
     def reset(self, pos: Optional[Sequence[Position]]=None, d: Optional[Direction]=None) -> None:
         super().reset(pos)
-        self.x_path.clear()
-        self.y_path.clear()
         self.dir_path.clear()
         if d is None:
             self.dir = self.initial_dir
@@ -44,15 +44,11 @@ class AbstractAISnakeAgent(AbstractSnakeAgent):
 
     def die(self) -> None:
         super().die()
-        self.x_path.clear()
-        self.y_path.clear()
         self.dir_path.clear()
 
     def decide_direction(self) -> Direction:
         self.update_path()
         if len(self.dir_path) > 0:
-            self.x_path.pop()
-            self.y_path.pop()
             self.dir = self.dir_path.pop()
         return self.dir
 
@@ -61,7 +57,11 @@ class AbstractAISnakeAgent(AbstractSnakeAgent):
 
     def inspect(self) -> Iterator[Position]:
         """Iterates over the positions of the path the AI snake is following."""
-        return zip(self.x_path, self.y_path)
+        return map(tuple, self.path[:len(self.dir_path)].tolist())
+
+    def _follow_path(self, x_path: list[int], y_path: list[int], dir_path: list[Direction]) -> None:
+        self.path = np.column_stack((x_path, y_path)).astype(np.int16, copy=False)
+        self.dir_path = dir_path
 
     def compute_shortest_path(
         self,
@@ -77,22 +77,35 @@ class AbstractAISnakeAgent(AbstractSnakeAgent):
         inf_len = max(inf_len, 0)
 
         head = self.get_head()
+        w, h = self.world.get_width(), self.world.get_height()
         destination_idx = None
         current_min = float('inf')
         path_len = 0
+        heuristic = None
 
         for i, dst in enumerate(destinations):
             if self.world.get_obstacle_count(dst) == 0:
-                heuristic = self.heuristic_type(self.get_world(), dst[0], dst[1])
+                # the length of a path on the periodic grid is at least the
+                # manhattan distance between its ends
+                dx, dy = abs(dst[0] - head[0]), abs(dst[1] - head[1])
+                min_path_len = min(dx, w - dx) + min(dy, h - dy)
+                if min_path_len >= min(current_min, sup_len):
+                    continue
+                # a path longer than one step reaches dst from a free neighbor
+                if min_path_len > 1 and next(self.world.iter_free_neighbors(dst), None) is None:
+                    continue
+
+                if heuristic is None:
+                    heuristic = self.heuristic_type(self.get_world(), dst[0], dst[1])
+                else:
+                    heuristic.reset(dst[0], dst[1])
                 x_path, y_path, dir_path = shortest_path(self.world, head, dst, heuristic, max_iteraton=450)
                 path_len = len(dir_path)
 
                 if inf_len < path_len < min(current_min, sup_len) and x_path[0] == dst[0] and y_path[0] == dst[1]:
                     destination_idx = i
                     current_min = path_len
-                    self.x_path = x_path
-                    self.y_path = y_path
-                    self.dir_path = dir_path
+                    self._follow_path(x_path, y_path, dir_path)
 
         return destination_idx
 
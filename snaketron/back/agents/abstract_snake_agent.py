@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import deque
+from itertools import chain, islice
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from typing import Iterator, Optional, Sequence
 
@@ -52,6 +55,19 @@ class AbstractSnakeAgent(ABC):
         """Iterates over the snake's cells from the head to the tail."""
         return reversed(self.pos)
 
+    def iter_body(self) -> Iterator[Position]:
+        """Iterates over the snake's cells from the one following the head to
+        the tail.
+        """
+        return islice(reversed(self.pos), 1, None)
+
+    def get_cells_array(self) -> np.ndarray:
+        """Returns a (len(self), 2) array of the snake's cells from the head to
+        the tail.
+        """
+        cells = np.fromiter(chain.from_iterable(reversed(self.pos)), dtype=np.int32, count=2*len(self.pos))
+        return cells.reshape(-1, 2)
+
     def reset(self, pos: Optional[Sequence[Position]]=None, d: Optional[Direction]=None) -> None:
         """Resets the snake to make it ready to spawn in the world."""
         self.alive = True
@@ -63,11 +79,12 @@ class AbstractSnakeAgent(ABC):
 
     def move(self, d: Direction) -> None:
         """Moves once the snake in the direction `d`."""
-        new_head = self.world.get_neighbor(self.pos[-1], d)
-        self.world.incr_obstacle_count(new_head, 1)
-        self.pos.append(new_head)
-        self.last_tail_pos = self.pos.popleft()
-        self.world.incr_obstacle_count(self.last_tail_pos, -1)
+        pos, incr_obstacle_count = self.pos, self.world.incr_obstacle_count
+        new_head = self.world.get_neighbor(pos[-1], d)
+        incr_obstacle_count(new_head, 1)
+        pos.append(new_head)
+        self.last_tail_pos = tail = pos.popleft()
+        incr_obstacle_count(tail, -1)
 
     def check_self_collision(self) -> int:
         """Returns the length which should be cutted from the snake's tail if it
@@ -80,8 +97,9 @@ class AbstractSnakeAgent(ABC):
 
     def cut(self, cut_length: int) -> None:
         """Removes the `cut_length` last cells from the snake (`cut_length > 0`)."""
+        popleft, incr_obstacle_count = self.pos.popleft, self.world.incr_obstacle_count
         for _ in range(cut_length):
-            self.world.incr_obstacle_count(self.pos.popleft(), -1)
+            incr_obstacle_count(popleft(), -1)
 
     def grow(self, growth: int) -> None:
         """Adds `growth` cells at the end of the snake's tail (`growth > 0`)."""
@@ -102,8 +120,9 @@ class AbstractSnakeAgent(ABC):
     def die(self) -> None:
         """Kills the snake."""
         self.alive = False
+        incr_obstacle_count = self.world.incr_obstacle_count
         for p in self.pos:
-            self.world.incr_obstacle_count(p, -1)
+            incr_obstacle_count(p, -1)
 
     def is_alive(self) -> bool:
         """Returns True if the snake is alive, False otherwise."""
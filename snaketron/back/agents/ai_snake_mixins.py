@@ -45,28 +45,30 @@ class CautionAISnakeMixin(AbstractAISnakeAgent):
 
         self.caution_radius = caution
 
-    def _start_avoid(self, dangerous_agents: Iterable[AbstractSnakeAgent]) -> list[list[Position]]:
+    def _start_avoid(self, dangerous_agents: Iterable[AbstractSnakeAgent]) -> list[Position]:
         """Add virtual obstacles in the world to avoid positions that are to close
-        to the dangerous snakes' heads.
+        to the dangerous snakes' heads, and returns their positions.
         """
-        danger_layers = []
+        iter_free_neighbors, incr_obstacle_count = self.world.iter_free_neighbors, self.world.incr_obstacle_count
+        danger_zone = []
+        append = danger_zone.append
         for agent in dangerous_agents:
+            layer_start = len(danger_zone)
             layer = (agent.get_head(),)
             for _ in range(self.caution_radius):
-                new_layer = []
                 for position in layer:
-                    for neighbor, direction in self.world.iter_free_neighbors(position):
-                        self.world.incr_obstacle_count(neighbor, 1)
-                        new_layer.append(neighbor)
-                danger_layers.append(new_layer)
-                layer = new_layer
-        return danger_layers
-
-    def _stop_avoid(self, danger_layers: list[list[Position]]) -> None:
+                    for neighbor, direction in iter_free_neighbors(position):
+                        incr_obstacle_count(neighbor, 1)
+                        append(neighbor)
+                layer = danger_zone[layer_start:]
+                layer_start += len(layer)
+        return danger_zone
+
+    def _stop_avoid(self, danger_zone: list[Position]) -> None:
         """Removes the virtual obstacles from the world."""
-        for layer in danger_layers:
-            for position in layer:
-                self.world.incr_obstacle_count(position, -1)
+        incr_obstacle_count = self.world.incr_obstacle_count
+        for position in danger_zone:
+            incr_obstacle_count(position, -1)
 
     def compute_path_with_caution(
         self,
@@ -106,20 +108,28 @@ class AttackAISnakeMixin(AbstractAISnakeAgent):
         If success, returns the index of the selected target in the
         potential_targets sequence, else returns None.
         """
+        get_neighbor = self.world.get_neighbor
+        get_obstacle_count = self.world.get_obstacle_count
+
         # initialize the list of potential attack destinations
+        potential_targets = list(potential_targets)
         impact_positions = [a.get_head() for a in potential_targets]
 
+        # scratch lists reused across iterations to avoid reallocating them
+        new_potential_targets: list[AbstractSnakeAgent] = []
+        new_impact_positions: list[Position] = []
+
         for impact_delay in range(1, self.attack_anticipation+1):
             # update the list of potential attack destinations
-            new_potential_targets: list[AbstractSnakeAgent] = []
-            new_impact_positions: list[Position] = []
+            new_potential_targets.clear()
+            new_impact_positions.clear()
             for agent, pos in zip(potential_targets, impact_positions):
-                pos = self.world.get_neighbor(pos, agent.get_direction())
-                if self.world.get_obstacle_count(pos) == 0:
+                pos = get_neighbor(pos, agent.get_direction())
+                if get_obstacle_count(pos) == 0:
                     new_impact_positions.append(pos)
                     new_potential_targets.append(agent)
-            potential_targets = new_potential_targets
-            impact_positions = new_impact_positions
+            potential_targets, new_potential_targets = new_potential_targets, potential_targets
+            impact_positions, new_impact_positions = new_impact_positions, impact_positions
 
             # arriving before the target implies len(attack_path) < impact_delay
             # not arriving too early implies len(attack_path) + len(self) > impact_delay
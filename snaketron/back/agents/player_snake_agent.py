@@ -35,7 +35,7 @@ class PlayerSnakeAgent(AbstractSnakeAgent):
         self.dir_requests.clear()
 
     def decide_direction(self) -> Direction:
-        if len(self.dir_requests) > 0:
+        if self.dir_requests:
             self.dir = self.dir_requests.popleft()
         return self.dir
 
@@ -45,7 +45,7 @@ class PlayerSnakeAgent(AbstractSnakeAgent):
     def add_dir_request(self, request: Direction) -> None:
         """Queues a new direction request in which to move the snake."""
         if len(self.dir_requests) < self.dir_requests.maxlen:
-            if len(self.dir_requests) > 0:
+            if self.dir_requests:
                 last_dir = self.dir_requests[-1]
             else:
                 last_dir = self.dir
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from back.type_hints import Direction
 
 if TYPE_CHECKING:
-    from typing import TypeAlias
+    from typing import Callable, TypeAlias
 
     from back.type_hints import Direction
     Real: TypeAlias = int|float
@@ -15,32 +15,23 @@ DOWN: Direction = (0, 1)
 LEFT: Direction = (-1, 0)
 RIGHT: Direction = (1, 0)
 
+OPPOSITE: dict[Direction, Direction] = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+opposite_dir: Callable[[Direction], Direction] = OPPOSITE.__getitem__
+
+
+# directions indexed by (above_diag_0 << 1 | above_diag_1), where the diagonals
+# of the world split it into four triangles
+_TOWARD_CENTER: tuple[Direction, ...] = (DOWN, LEFT, RIGHT, UP)
+_AWAY_FROM_CENTER: tuple[Direction, ...] = (UP, RIGHT, LEFT, DOWN)
+
 
 def toward_center(x: Real, y: Real, width: Real, height: Real) -> Direction:
-    above_diag_0 = (y > (height/width * x))
-    above_diag_1 = (y > (-height/width * (x-width)))
-    if above_diag_0 and above_diag_1:
-        return UP
-    elif above_diag_0 and not above_diag_1:
-        return RIGHT
-    elif not above_diag_0 and above_diag_1:
-        return LEFT
-    elif not above_diag_0 and not above_diag_1:
-        return DOWN
+    above_diag_0 = (y*width > height*x)
+    above_diag_1 = (y*width > height*(width-x))
+    return _TOWARD_CENTER[above_diag_0 << 1 | above_diag_1]
 
 
 def away_from_center(x: Real, y: Real, width: Real, height: Real) -> Direction:
-    above_diag_0 = (y > (height/width * x))
-    above_diag_1 = (y > (-height/width * (x-width)))
-    if above_diag_0 and above_diag_1:
-        return DOWN
-    elif above_diag_0 and not above_diag_1:
-        return LEFT
-    elif not above_diag_0 and above_diag_1:
-        return RIGHT
-    elif not above_diag_0 and not above_diag_1:
-        return UP
-
-
-def opposite_dir(d: Direction) -> Direction:
-    return (-d[0], -d[1])
+    above_diag_0 = (y*width > height*x)
+    above_diag_1 = (y*width > height*(width-x))
+    return _AWAY_FROM_CENTER[above_diag_0 << 1 | above_diag_1]
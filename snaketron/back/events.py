@@ -13,33 +13,33 @@ if TYPE_CHECKING:
 
 
 class ArenaEvent:
-    pass
+    __slots__ = ()
 
-@dataclass
+@dataclass(slots=True)
 class FoodCreated(ArenaEvent):
     pos: Position
 
-@dataclass
+@dataclass(slots=True)
 class FoodConsumed(ArenaEvent):
     pos: Position
     by: Optional[int]
 
 
 class AgentEvent:
-    pass
+    __slots__ = ()
 
 class SnakeSimpleEvent(AgentEvent, IntEnum):
     SPAWN = auto()
     DIE = auto()
     DASH = auto()
 
-@dataclass
+@dataclass(slots=True)
 class SnakeMovement(AgentEvent):
     new_head_pos: Position
     new_dir: Direction
     growth: int
 
-@dataclass
+@dataclass(slots=True)
 class SnakeWrap(AgentEvent):
     cell_idx: int
     new_cell_pos: Position
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -20,13 +21,16 @@ def furthest_voronoi_vertex(points: PointArray, x_lim: float, y_lim: float) -> O
     except QhullError:
         return
 
+    # scatters the index of each point over the vertices of its region, the
+    # vertex at infinity (index -1) being written in an extra last slot
     n_vertices = vor.vertices.shape[0]
+    point_regions = [vor.regions[region_idx] for region_idx in vor.point_region]
+    region_sizes = np.fromiter(map(len, point_regions), dtype=np.intp, count=len(point_regions))
     vertex_nearest_point = np.empty(n_vertices+1, dtype=np.int32)
-    for point_idx, region_idx in enumerate(vor.point_region):
-        vertice_idx = vor.regions[region_idx]
-        vertex_nearest_point[vertice_idx] = point_idx
+    vertex_nearest_point[np.fromiter(chain.from_iterable(point_regions), dtype=np.intp)] = (
+        np.repeat(np.arange(len(point_regions), dtype=np.int32), region_sizes)
+    )
     vertex_nearest_point = vertex_nearest_point[:n_vertices]
-    vertex_squared_radius = np.sum((vor.vertices - points[vertex_nearest_point])**2, axis=1)
 
     candidate_mask = (
         (vor.vertices[:, 0] >= 0) & (vor.vertices[:, 0] < x_lim) &
@@ -36,5 +40,9 @@ def furthest_voronoi_vertex(points: PointArray, x_lim: float, y_lim: float) -> O
     if candidates.shape[0] == 0:
         return
 
-    candidate_squared_radius = vertex_squared_radius[candidate_mask]
+    # only the radii of the candidate vertices are computed
+    nearest_points = points[vertex_nearest_point[candidate_mask]]
+    dx = candidates[:, 0] - nearest_points[:, 0]
+    dy = candidates[:, 1] - nearest_points[:, 1]
+    candidate_squared_radius = dx*dx + dy*dy
     return candidates[np.argmax(candidate_squared_radius)]
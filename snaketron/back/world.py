@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import Counter, deque
 from itertools import chain
-from random import randrange, shuffle
+from random import choice, randrange, shuffle
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -20,44 +20,72 @@ if TYPE_CHECKING:
 
 
 class AbstractHeuristic(ABC):
-    @abstractmethod
+    __slots__ = ('graph_width', 'graph_height', 'x_dst', 'y_dst', 'cache')
+
     def __init__(self, graph: AbstractGridGraph, x_dst: int, y_dst: int) -> None:
-        pass
+        self.graph_width = graph.get_width()
+        self.graph_height = graph.get_height()
+        self.reset(x_dst, y_dst)
+
+    def reset(self, x_dst: int, y_dst: int) -> None:
+        """Changes the destination whose distance is estimated, so that the
+        heuristic can be reused for another search.
+        """
+        self.x_dst = x_dst
+        self.y_dst = y_dst
+        # estimates already computed, indexed by [x][y], -1 when not computed,
+        # allocated by the first call so that a destination which is not
+        # searched does not pay for it
+        self.cache = None
 
-    @abstractmethod
     def __call__(self, x: int, y: int) -> int:
-        pass
+        cache = self.cache
+        if cache is None:
+            cache = self.cache = [[-1] * self.graph_height for _ in range(self.graph_width)]
+        h = cache[x][y]
+        if h < 0:
+            h = cache[x][y] = self.estimate(x, y)
+        return h
+
+    @abstractmethod
+    def estimate(self, x: int, y: int) -> int:
+        """Estimates the distance from position (x, y) to the destination."""
 
 
 class EuclidianDistanceHeuristic(AbstractHeuristic):
-    def __init__(self, graph: AbstractGridGraph, x_dst: int, y_dst: int) -> None:
-        self.x_dst = x_dst
-        self.y_dst = y_dst
+    __slots__ = ()
 
-    def __call__(self, x: int, y: int) -> int:
+    def estimate(self, x: int, y: int) -> int:
         dx, dy = self.x_dst - x, self.y_dst - y
         return dx*dx + dy*dy
 
 
 class ManhattanDistanceHeuristic(AbstractHeuristic):
-    def __init__(self, graph: AbstractGridGraph, x_dst: int, y_dst: int) -> None:
-        self.x_dst = x_dst
-        self.y_dst = y_dst
+    __slots__ = ()
 
-    def __call__(self, x: int, y: int) -> int:
+    def estimate(self, x: int, y: int) -> int:
         return abs(self.x_dst - x) + abs(self.y_dst - y)
 
 
 class EuclidianDistancePeriodicHeuristic(AbstractHeuristic):
+    __slots__ = ('h', 'w', 'half_h', 'half_w')
+
     def __init__(self, graph: AbstractGridGraph, x_dst: int, y_dst: int) -> None:
         self.h = graph.get_height()
         self.w = graph.get_width()
-        self.x_dst = x_dst
-        self.y_dst = y_dst
-
-    def __call__(self, x: int, y: int) -> int:
-        dx, dy = abs(self.x_dst - x), abs(self.y_dst - y)
-        dx, dy = min(dx, self.w - dx), min(dy, self.h - dy)
+        self.half_h = self.h // 2
+        self.half_w = self.w // 2
+        super().__init__(graph, x_dst, y_dst)
+
+    def estimate(self, x: int, y: int) -> int:
+        # the shortest way along an axis wraps around when it is longer than
+        # half of the world
+        dx = abs(self.x_dst - x)
+        if dx > self.half_w:
+            dx = self.w - dx
+        dy = abs(self.y_dst - y)
+        if dy > self.half_h:
+            dy = self.h - dy
         return dx*dx + dy*dy
 
 
@@ -96,6 +124,11 @@ class SnakeWorld(AbstractGridGraph):
 
         self.width = width
         self.height = height
+        # wrapped coordinates of the previous and next cells along each axis
+        self.prev_x = tuple((x-1) % width for x in range(width))
+        self.next_x = tuple((x+1) % width for x in range(width))
+        self.prev_y = tuple((y-1) % height for y in range(height))
+        self.next_y = tuple((y+1) % height for y in range(height))
         self.initial_n_food = n_food
         if respawn_cooldown is None:
             self.initial_respawn_cooldown = float('+inf')
@@ -109,38 +142,41 @@ class SnakeWorld(AbstractGridGraph):
         self.respawn_cooldown = self.initial_respawn_cooldown
         self.alive_agents: list[AbstractSnakeAgent] = []
         self.dead_agents: deque[AbstractSnakeAgent] = deque()
+        self.next_agent_id = 0
 
         # used to update the world state during simulation steps
         self.dir_buffer: list[Direction] = []
-        self.len_buffer: list[int] = []
         self.deaths: list[AbstractSnakeAgent] = []  # agents which died during the current simulation steps
         self.agent_movement_events: list[SnakeMovement] = []
 
     def __repr__(self) -> str:
-        repr_grid = [['  .  '  for x in range(self.width)] for y in range(self.height)]
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.obstacle_count[x, y] > 0:
-                    repr_grid[y][x] = f" {self.obstacle_count[x, y]:03d} "
-                if (x, y) in self.food_pos:
-                    repr_grid[y][x] = "  *  "
-        return '\n'.join(''.join(row) for row in repr_grid) + '\n'
+        obstacle_count = self.obstacle_count.T
+        repr_grid = np.full((self.height, self.width), '  .  ', dtype='<U5')
+        obstacle_mask = obstacle_count > 0
+        repr_grid[obstacle_mask] = np.char.mod(' %03d ', obstacle_count[obstacle_mask])
+        for x, y in self.food_pos:
+            repr_grid[y, x] = '  *  '
+        return '\n'.join(''.join(row) for row in repr_grid.tolist()) + '\n'
 
     # ---- private
     def _move_agents(self) -> None:
+        alive_agents = self.alive_agents
+        dir_buffer = self.dir_buffer
+        movement_events = self.agent_movement_events
+
         # each snake decides in which direction it should move
-        for agent in self.alive_agents:
-            self.dir_buffer[agent.get_id()] = agent.decide_direction()
+        for agent in alive_agents:
+            dir_buffer[agent.get_id()] = agent.decide_direction()
 
         # each snake moves at the same time
-        for agent in self.alive_agents:
+        for agent in alive_agents:
             agent_id = agent.get_id()
-            agent.move(self.dir_buffer[agent_id])
-            movement_event = self.agent_movement_events[agent_id]
+            agent.move(dir_buffer[agent_id])
+            movement_event = movement_events[agent_id]
             movement_event.new_head_pos = agent.get_head()
             movement_event.new_dir = agent.get_direction()
 
-    def _eat_food(self, agent: AbstractSnakeAgent) -> int:
+    def _eat_food(self, agent: AbstractSnakeAgent, head_counts: Counter[Position]) -> int:
         """If there is food at the snage agent head position, and if no other
         snake head occupies this position, removes that food and returns the
         number of cells the snake agent should grows for eating it.
@@ -148,37 +184,32 @@ class SnakeWorld(AbstractGridGraph):
         """
         p = agent.get_head()
         if p in self.food_pos:
-            head_count = sum((agent.get_head() == p) for agent in self.alive_agents)
-            if head_count == 1:
+            if head_counts[p] == 1:
                 self.food_pos.remove(p)
                 self.event_sender.send_arena_event(FoodConsumed(p, agent.get_id()))
                 return 1
         return 0
 
     def _grow_agents(self) -> None:
-        # finds the snakes which eat a food
+        # each snake which eats a food grows, whether a snake eats does not
+        # depend on the growth of the others so both are done in one pass
+        head_counts = Counter(agent.get_head() for agent in self.alive_agents)
+        movement_events = self.agent_movement_events
         for agent in self.alive_agents:
-            self.len_buffer[agent.get_id()] = self._eat_food(agent)
-
-        # grows at the same time each snake which eats a food
-        for agent in self.alive_agents:
-            agent_id = agent.get_id()
-            growth = self.len_buffer[agent.get_id()]
-            agent.grow(growth)
-            self.agent_movement_events[agent_id].growth = growth
+            growth = self._eat_food(agent, head_counts)
+            if growth > 0:
+                agent.grow(growth)
+            movement_events[agent.get_id()].growth = growth
 
     def _resolve_self_collisions(self) -> None:
-        # finds the snakes which eat their own tail
-        for agent in self.alive_agents:
-            self.len_buffer[agent.get_id()] = agent.check_self_collision()
-
-        # cuts at the same time each snake which eats their own tail
+        # each snake which eats its own tail is cut, a snake only collides with
+        # its own cells so the cuts of the others do not change its collision
+        movement_events = self.agent_movement_events
         for agent in self.alive_agents:
-            agent_id = agent.get_id()
-            cut_length = self.len_buffer[agent_id]
+            cut_length = agent.check_self_collision()
             if cut_length > 0:
                 agent.cut(cut_length)
-                self.agent_movement_events[agent_id].growth = -cut_length
+                movement_events[agent.get_id()].growth = -cut_length
 
     def _resolve_cross_collisions(self) -> None:
         # finds the snakes which collide with others
@@ -188,22 +219,38 @@ class SnakeWorld(AbstractGridGraph):
                 self.deaths.append(agent)
 
         # kills at the same time each snake which collides with another
+        if len(self.deaths) == 0:
+            return
         shuffle(self.deaths)
         for agent in self.deaths:
             agent.die()
-            self.alive_agents.remove(agent)
             self.dead_agents.append(agent)
             self.event_sender.send_agent_event(agent.get_id(), SnakeSimpleEvent.DIE)
 
+        # removes all the dead snakes from the alive ones in a single pass
+        deaths = set(self.deaths)
+        self.alive_agents[:] = [agent for agent in self.alive_agents if agent not in deaths]
+
     def _find_available_food_pos(self, max_try: int=20) -> Optional[Position]:
-        """Tries to find an available position to spawn a new food and returns
-        it if found.
+        """Finds an available position to spawn a new food and returns it, or
+        returns None if there is no such position.
         """
+        w, h = self.width, self.height
+        obstacle_count = self.obstacle_count
+        food_pos = self.food_pos
         for _ in range(max_try):
-            pos = (randrange(self.width), randrange(self.height))
-            if self.obstacle_count[pos] == 0 and pos not in self.food_pos:
+            pos = (randrange(w), randrange(h))
+            if obstacle_count[pos] == 0 and pos not in food_pos:
                 return pos
 
+        # the world is crowded, picks uniformly among all the available positions
+        free_x, free_y = np.nonzero(obstacle_count == 0)
+        available_pos = [
+            pos for pos in zip(free_x.tolist(), free_y.tolist()) if pos not in food_pos
+        ]
+        if len(available_pos) > 0:
+            return choice(available_pos)
+
     def _spawn_missing_food(self) -> None:
         # q, r = divmod(len(self.alive_agents), 2)
         # n_food = q + (r != 0)
@@ -217,17 +264,15 @@ class SnakeWorld(AbstractGridGraph):
 
     def _find_agent_spawn_pos(self) -> Optional[Position]:
         """Tries to find a position to spawn an agent and returns it if found."""
-        repellent_pos = []
-        for agent in self.alive_agents:
-            repellent_pos.extend(agent.iter_cells())
+        repellent_pos = [agent.get_cells_array() for agent in self.alive_agents]
         if len(self.alive_agents) <= 2:
             max_x, max_y = self.width - 1., self.height - 1.
             half_x, half_y = .5 * max_x, .5 * max_y
-            repellent_pos.extend((
+            repellent_pos.append(np.array((
                 (half_x, 0.), (half_x, max_y), (0., half_y), (max_x, half_y)
-            ))
+            )))
 
-        vertex = furthest_voronoi_vertex(np.array(repellent_pos), self.width, self.height)
+        vertex = furthest_voronoi_vertex(np.concatenate(repellent_pos), self.width, self.height)
         if vertex is not None:
             x, y = vertex
             spawn_pos = (int(x), int(y))
@@ -235,9 +280,9 @@ class SnakeWorld(AbstractGridGraph):
                 return spawn_pos
 
     def _respawn_dead_agent(self) -> None:
-        if len(self.dead_agents) == 0:
-            return
-
+        """Respawns the first dead agent once the cooldown is over (there must
+        be at least one dead agent).
+        """
         if self.respawn_cooldown > 0:
             self.respawn_cooldown -= 1
             return
@@ -277,22 +322,25 @@ class SnakeWorld(AbstractGridGraph):
         return self.obstacle_count[p]
 
     def get_neighbor(self, p: Position, d: Direction) -> Position:
-        return (p[0] + d[0]) % self.width, (p[1] + d[1]) % self.height
+        x, y = p
+        dx, dy = d
+        return (x + dx) % self.width, (y + dy) % self.height
 
     def iter_free_neighbors(self, p: Position) -> Iterator[tuple[Position, Direction]]:
         x, y = p
-        up_neighbor = (x, (y-1) % self.height)
-        down_neighbor = (x, (y+1) % self.height)
-        left_neighbor = ((x-1) % self.width, y)
-        right_neighbor = ((x+1) % self.width, y)
+        obstacle_count = self.obstacle_count
+        up_neighbor = (x, self.prev_y[y])
+        down_neighbor = (x, self.next_y[y])
+        left_neighbor = (self.prev_x[x], y)
+        right_neighbor = (self.next_x[x], y)
 
-        if self.obstacle_count[up_neighbor] == 0:
+        if obstacle_count[up_neighbor] == 0:
             yield up_neighbor, UP
-        if self.obstacle_count[down_neighbor] == 0:
+        if obstacle_count[down_neighbor] == 0:
             yield down_neighbor, DOWN
-        if self.obstacle_count[left_neighbor] == 0:
+        if obstacle_count[left_neighbor] == 0:
             yield left_neighbor, LEFT
-        if self.obstacle_count[right_neighbor] == 0:
+        if obstacle_count[right_neighbor] == 0:
             yield right_neighbor, RIGHT
 
     def iter_food(self) -> Iterator[Position]:
@@ -314,8 +362,8 @@ class SnakeWorld(AbstractGridGraph):
 
     def attach_agent(self, agent: AbstractSnakeAgent) -> None:
         """Adds a new agent in the world."""
-        agent_id = len(self.alive_agents) + len(self.dead_agents)
-        agent.set_id(agent_id)
+        agent.set_id(self.next_agent_id)
+        self.next_agent_id += 1
 
         agent_dir = agent.get_direction()
         agent_head = agent.get_head()
@@ -326,7 +374,6 @@ class SnakeWorld(AbstractGridGraph):
             self.dead_agents.append(agent)
 
         self.dir_buffer.append(agent_dir)
-        self.len_buffer.append(0)
         self.agent_movement_events.append(SnakeMovement(agent_head, agent_dir, 0))
 
     def reset(self) -> None:
@@ -354,5 +401,7 @@ class SnakeWorld(AbstractGridGraph):
         self._resolve_self_collisions()
         self._resolve_cross_collisions()
         self._send_agent_movement_events()
-        self._spawn_missing_food()
-        self._respawn_dead_agent()
+        if len(self.food_pos) < self.initial_n_food:
+            self._spawn_missing_food()
+        if self.dead_agents:
+            self._respawn_dead_agent()
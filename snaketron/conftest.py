@@ -0,0 +1,2 @@
+# puts this directory on sys.path so that the tests import the back and
+# front packages the same way the application does
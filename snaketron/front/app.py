@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from front.controls import *
-from front.score_board import *
-from front.window import *
-from front.world_display import *
+# the widget classes used by the kv layout files are registered to the kivy
+# factory when imported
+from front.controls import PlayerSwipeControl, SwipeControlZone  # noqa: F401 (used by the kv layouts)
+from front.score_board import ScoreBoard  # noqa: F401 (used by the kv layouts)
+from front.window import SnakeTronWindow
+from front.world_display import WorldDisplay  # noqa: F401 (used by the kv layouts)
 
 from kivy.app import App
 from kivy.lang import Builder
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from itertools import chain
+from itertools import chain, cycle
 from typing import TYPE_CHECKING
 
 from back.direction import DOWN, LEFT, RIGHT, UP
@@ -24,6 +24,20 @@ if TYPE_CHECKING:
     from kivy.uix.widget import Widget
 
 
+# swipe direction indexed by (horizontal << 1 | positive), the y axis of the
+# screen being oriented upward
+SWIPE_DIRECTIONS: tuple[Direction, ...] = (DOWN, UP, LEFT, RIGHT)
+
+# points of the arrow displayed for each direction, relative to the center of
+# the control and in units of the arrow size
+ARROW_POINTS: dict[Direction, tuple[float, ...]] = {
+    UP: (0., -1., 0., 1., -.5, .5, 0., 1., .5, .5),
+    DOWN: (0., 1., 0., -1., -.5, -.5, 0., -1., .5, -.5),
+    LEFT: (1., 0., -1., 0., -.5, .5, -1., 0., -.5, -.5),
+    RIGHT: (-1., 0., 1., 0., .5, .5, 1., 0., .5, -.5),
+}
+
+
 class SwipeDirectionFilter:
     def __init__(self, initial_dir: Direction):
         self.reset(initial_dir)
@@ -61,6 +75,9 @@ class PlayerSwipeControl(FloatLayout):
     player: PlayerSnakeAgent
     colors: SnakeColors
 
+    # (alive, direction, x, y, width, height) of the current display
+    displayed_state: Optional[tuple]
+
     min_seg_sqr_len: float
     touch_uid: Optional[int]
     prev_touch_pos: tuple[float, float]
@@ -69,6 +86,7 @@ class PlayerSwipeControl(FloatLayout):
     def on_kv_post(self, base_widget: Widget) -> None:
         self.draw_instr = InstructionGroup()
         self.canvas.add(self.draw_instr)
+        self.displayed_state = None
         self.touch_starts = {}
 
     def init_logic(
@@ -108,10 +126,9 @@ class PlayerSwipeControl(FloatLayout):
         if dx*dx + dy*dy < self.min_seg_sqr_len:
             return True
 
-        if abs(dx) > abs(dy):
-            direction = RIGHT if dx > 0 else LEFT
-        else:
-            direction = UP if dy > 0 else DOWN
+        horizontal = abs(dx) > abs(dy)
+        positive = (dx if horizontal else dy) > 0
+        direction = SWIPE_DIRECTIONS[horizontal << 1 | positive]
 
         if self.control_filter.filter(direction):
             self.player.add_dir_request(direction)
@@ -133,28 +150,26 @@ class PlayerSwipeControl(FloatLayout):
         self.update_direction_display()
 
     def update_direction_display(self) -> None:
+        # the display is only rebuilt when something it depends on changed
+        alive = self.player.is_alive()
+        direction = self.player.get_direction()
+        displayed_state = (alive, direction, self.x, self.y, self.width, self.height)
+        if displayed_state == self.displayed_state:
+            return
+        self.displayed_state = displayed_state
+
         self.draw_instr.clear()
 
-        if not self.player.is_alive():
+        if not alive:
             return
 
-        cx, cy = self.center
-        size = min(self.width, self.height) * 0.2
-        direction = self.player.get_direction()
-        if direction == UP:
-            points = (cx, cy - size, cx, cy + size, cx - size * 0.5, cy + size * 0.5,
-                      cx, cy + size, cx + size * 0.5, cy + size * 0.5)
-        elif direction == DOWN:
-            points = (cx, cy + size, cx, cy - size, cx - size * 0.5, cy - size * 0.5,
-                      cx, cy - size, cx + size * 0.5, cy - size * 0.5)
-        elif direction == LEFT:
-            points = (cx + size, cy, cx - size, cy, cx - size * 0.5, cy + size * 0.5,
-                      cx - size, cy, cx - size * 0.5, cy - size * 0.5)
-        elif direction == RIGHT:
-            points = (cx - size, cy, cx + size, cy, cx + size * 0.5, cy + size * 0.5,
-                      cx + size, cy, cx + size * 0.5, cy - size * 0.5)
-        else:
+        arrow_points = ARROW_POINTS.get(direction)
+        if arrow_points is None:
             return
+        size = min(self.width, self.height) * 0.2
+        points = tuple(
+            center + size * u for center, u in zip(cycle(self.center), arrow_points)
+        )
 
         self.draw_instr.add(Color(rgba=self.colors.tail))
         self.draw_instr.add(Line(points=points, width=2, cap='round', joint='round'))
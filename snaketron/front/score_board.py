@@ -22,6 +22,7 @@ class ScoreBoard(BoxLayout):
     snakes: Sequence[AbstractSnakeAgent]
     snake_colors: dict[int, SnakeColors]
     labels: dict[int, Label]
+    scores: dict[int, int]
 
     def init_logic(
         self,
@@ -31,16 +32,25 @@ class ScoreBoard(BoxLayout):
         self.snakes = snakes
         self.snake_colors = snake_colors
         self.labels = {}
+        self.scores = {}
         for snake in self.snakes:
             snake_id = snake.get_id()
+            score = len(snake)
             label = ColoredLabel(
-                text=str(len(snake)),
+                text=str(score),
                 color=get_color_from_hex('#FFFFFF'),
                 box_color=self.snake_colors[snake_id].tail
             )
             self.labels[snake_id] = label
+            self.scores[snake_id] = score
             self.add_widget(label)
 
     def update_scores(self) -> None:
+        # only touches the labels whose score changed, since setting a label
+        # text triggers the re-rendering of its texture
         for snake in self.snakes:
-            self.labels[snake.get_id()].text = str(len(snake))
+            snake_id = snake.get_id()
+            score = len(snake)
+            if score != self.scores[snake_id]:
+                self.scores[snake_id] = score
+                self.labels[snake_id].text = str(score)
@@ -12,12 +12,14 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.utils import get_color_from_hex
 
 if TYPE_CHECKING:
-    from typing import Iterable, Sequence
+    from typing import Callable, Iterable, Sequence
 
     from front.type_hints import ColorValue
     from back.agents import AbstractSnakeAgent, AbstractAISnakeAgent, PlayerSnakeAgent
     from back.events import EventReceiver
     from back.world import SnakeWorld
+    from front.score_board import ScoreBoard
+    from front.world_display import WorldDisplay
     from kivy.clock import ClockEvent
     from kivy.uix.widget import Widget
 
@@ -29,6 +31,8 @@ class SnakeTronWindow(BoxLayout):
     app_background_color = ListProperty(get_color_from_hex('#000000'))
 
     world: SnakeWorld
+    world_display: WorldDisplay
+    score_board: ScoreBoard
     player_agents: Sequence[PlayerSnakeAgent]
     swipe_zones: list[SwipeControlZone]
     swipe_controls: list[PlayerSwipeControl]
@@ -39,7 +43,15 @@ class SnakeTronWindow(BoxLayout):
     time_step: float
     clock_event: ClockEvent
 
+    # methods called at each game step, bound once
+    simulate_world: Callable[[], None]
+    update_world_display: Callable[[float], None]
+    update_score_board: Callable[[], None]
+    update_direction_displays: list[Callable[[], None]]
+
     def on_kv_post(self, base_widget: Widget) -> None:
+        self.world_display = self.ids.world_display
+        self.score_board = self.ids.score_board
         self.swipe_zones = []
         for child in self.children:
             if isinstance(child, SwipeControlZone):
@@ -69,10 +81,10 @@ class SnakeTronWindow(BoxLayout):
         return self.full_speed
 
     def toggle_ai_explanations(self) -> None:
-        self.ids.world_display.toggle_ai_explanations()
+        self.world_display.toggle_ai_explanations()
 
     def ai_explanations_is_enabled(self) -> bool:
-        return self.ids.world_display.ai_explanations_is_enabled()
+        return self.world_display.ai_explanations_is_enabled()
 
 
     def init_logic(
@@ -107,15 +119,22 @@ class SnakeTronWindow(BoxLayout):
         self.app_background_color = get_color_from_hex(colors['ui']['background'])
 
         # propagates logic to child widgets
-        self.ids.world_display.init_logic(
+        self.world_display.init_logic(
             self, event_receiver, world, ai_agents, world_colors, agent_colors
         )
-        self.ids.score_board.init_logic(agents, agent_colors)
+        self.score_board.init_logic(agents, agent_colors)
         self._init_logic_keyboard_inputs(player_agents)
         self._init_logic_touchscreen_inputs(
             player_agents, swipe_zone_bg_color, agent_colors, input_sensitivity
         )
 
+        self.simulate_world = world.simulate
+        self.update_world_display = self.world_display.update_draw
+        self.update_score_board = self.score_board.update_scores
+        self.update_direction_displays = [
+            controller.update_direction_display for controller in self.swipe_controls
+        ]
+
         if ai_explanations:
             self.toggle_ai_explanations()
 
@@ -179,8 +198,8 @@ class SnakeTronWindow(BoxLayout):
 
 
     def game_step(self, dt: float) -> None:
-        self.world.simulate()
-        self.ids.world_display.update_draw(self.time_step)
-        self.ids.score_board.update_scores()
-        for controller in self.swipe_controls:
-            controller.update_direction_display()
+        self.simulate_world()
+        self.update_world_display(self.time_step)
+        self.update_score_board()
+        for update_direction_display in self.update_direction_displays:
+            update_direction_display()
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from kivy.animation import Animation
 from kivy.event import EventDispatcher
-from kivy.graphics import Color, Ellipse, InstructionGroup, Line, Rectangle
+from kivy.graphics import Color, Ellipse, InstructionGroup, Line, Mesh, Rectangle
 from kivy.properties import NumericProperty, ReferenceListProperty, ListProperty
 from kivy.uix.floatlayout import FloatLayout
 
@@ -64,6 +64,11 @@ class WorldDisplay(FloatLayout):
     world_colors: WorldColors
     snake_colors: SnakeColors
 
+    # screen coordinates of each world column and row, and size of a square
+    x_coords: list[float]
+    y_coords: list[float]
+    square_dims: tuple[float, float]
+
     def init_logic(
         self,
         main_window: SnakeTronWindow,
@@ -77,6 +82,7 @@ class WorldDisplay(FloatLayout):
         self.event_receiver = event_receiver
         self.world = world
         self.ai_explanations = False
+        self._recompute_coords(self.square_size)
 
         self.arena_drawer = ArenaDrawer(self, world, world_colors)
 
@@ -100,16 +106,23 @@ class WorldDisplay(FloatLayout):
         self.arena_drawer.erase_and_draw()
 
     def pos_to_coord(self, pos: Position) -> Coordinate:
-        return (
-            self.x + float(pos[0]) * self.square_size,
-            self.y + (self.world.get_height() - 1 - float(pos[1])) * self.square_size
-        )
+        return self.x_coords[pos[0]], self.y_coords[pos[1]]
+
+    def _recompute_coords(self, square_size: float) -> None:
+        h = self.world.get_height()
+        self.x_coords = [self.x + u * square_size for u in range(self.world.get_width())]
+        self.y_coords = [self.y + (h - 1 - v) * square_size for v in range(h)]
+        self.square_dims = (square_size, square_size)
 
     def _recompute_square_size(self) -> None:
-        self.square_size = min(
+        square_size = min(
             self.height / self.world.get_height(),
             self.width / self.world.get_width()
         )
+        # coordinates are updated first since they are used by the redraw
+        # triggered by the square_size change
+        self._recompute_coords(square_size)
+        self.square_size = square_size
 
     def on_square_size(self, instance: Widget, value: float) -> None:
         self.arena_drawer.erase_and_draw()
@@ -184,7 +197,7 @@ class WorldDisplay(FloatLayout):
     def update_draw(self, time_step: float) -> None:
         if self.ai_explanations:
             for ai_inspection_drawer in self.ai_inspection_drawers:
-                ai_inspection_drawer.erase_and_draw()
+                ai_inspection_drawer.update_draw()
 
         self._draw_arena_events()
         self._draw_agent_events(time_step)
@@ -202,18 +215,42 @@ class AiInspectionDrawer:
 
         self.instr = InstructionGroup()
         self.display.canvas.add(self.instr)
-        self.color_values = colors
+        self.inspect_color = Color(*colors.inspect)
+
+        # drawn path positions and their squares
+        self.drawn_path: list[Position] = []
+        self.squares: list[Rectangle] = []
 
     def erase(self) -> None:
         self.instr.clear()
+        self.drawn_path.clear()
+        self.squares.clear()
 
     def erase_and_draw(self) -> None:
-        self.instr.clear()
-        self.instr.add(Color(*self.color_values.inspect))
-        s = self.display.square_size
-        for pos in self.snake.inspect():
-            x, y = self.display.pos_to_coord(pos)
-            self.instr.add(Rectangle(pos=(x, y), size=(s, s)))
+        self.erase()
+        add = self.instr.add
+        pos_to_coord = self.display.pos_to_coord
+        add(self.inspect_color)
+        square_dims = self.display.square_dims
+        self.drawn_path.extend(self.snake.inspect())
+        for pos in self.drawn_path:
+            sqr = Rectangle(pos=pos_to_coord(pos), size=square_dims)
+            self.squares.append(sqr)
+            add(sqr)
+
+    def update_draw(self) -> None:
+        """Updates the drawing of the inspected path, only erasing the squares
+        of the reached steps while the snake keeps following the same path.
+        """
+        path = list(self.snake.inspect())
+        n = len(path)
+        if n <= len(self.drawn_path) and path == self.drawn_path[:n]:
+            for sqr in self.squares[n:]:
+                self.instr.remove(sqr)
+            del self.drawn_path[n:]
+            del self.squares[n:]
+        else:
+            self.erase_and_draw()
 
 
 class ArenaDrawer:
@@ -228,49 +265,38 @@ class ArenaDrawer:
 
         self.instr = InstructionGroup()
         self.display.canvas.add(self.instr)
-        self.color_values = colors
+        self.background_color = Color(*colors.background)
+        self.gridline_color = Color(*colors.gridline)
+        self.gridborder_color = Color(*colors.gridborder)
 
     def erase_and_draw(self) -> None:
         self.instr.clear()
+        add = self.instr.add
         h, w = self.world.get_height(), self.world.get_width()
         display_x, display_y = self.display.pos
         display_s = self.display.square_size
 
         # background
-        self.instr.add(Color(*self.color_values.background))
-        self.instr.add(Rectangle(pos=(display_x, display_y), size=(w*display_s, h*display_s)))
-
-        # grid lines every 3 cells
-        self.instr.add(Color(*self.color_values.gridline))
+        add(self.background_color)
+        add(Rectangle(pos=(display_x, display_y), size=(w*display_s, h*display_s)))
+
+        # grid lines every 3 cells, drawn as independent segments of a single
+        # mesh whose vertices are (x, y, u, v)
+        x0, x1 = display_x, display_x + w*display_s
+        y0, y1 = display_y, display_y + h*display_s
+        vertices = []
         for u in range(3, w, 3):
             x = display_x + u*display_s
-            y0 = display_y
-            y1 = display_y + h*display_s
-            self.instr.add(Line(points=(x, y0, x, y1)))
+            vertices += (x, y0, 0., 0., x, y1, 0., 0.)
         for v in range(3, h, 3):
             y = display_y + (h-v)*display_s
-            x0 = display_x
-            x1 = display_x + w*display_s
-            self.instr.add(Line(points=(x0, y, x1, y)))
+            vertices += (x0, y, 0., 0., x1, y, 0., 0.)
+        add(self.gridline_color)
+        add(Mesh(vertices=vertices, indices=list(range(len(vertices) // 4)), mode='lines'))
 
         # grid border
-        self.instr.add(Color(*self.color_values.gridborder))
-        self.instr.add(Line(points=(
-            display_x, display_y,
-            display_x + w*display_s, display_y
-        )))
-        self.instr.add(Line(points=(
-            display_x, display_y + h*display_s,
-            display_x + w*display_s, display_y + h*display_s
-        )))
-        self.instr.add(Line(points=(
-            display_x, display_y,
-            display_x, display_y + h*display_s
-        )))
-        self.instr.add(Line(points=(
-            display_x + w*display_s, display_y,
-            display_x + w*display_s, display_y + h*display_s
-        )))
+        add(self.gridborder_color)
+        add(Line(rectangle=(x0, y0, w*display_s, h*display_s)))
 
 
 class FoodDrawUpdater:
@@ -288,17 +314,16 @@ class FoodDrawUpdater:
         self.foods: dict[Position, Ellipse] = {}
 
 
-    def _circle(self, pos: Position) -> None:
-        x, y = self.display.pos_to_coord(pos)
-        s = self.display.square_size
-        return Ellipse(pos=(x, y), size=(s, s))
+    def _circle(self, pos: Position) -> Ellipse:
+        return Ellipse(pos=self.display.pos_to_coord(pos), size=self.display.square_dims)
 
     def reset(self) -> None:
         self.instr.clear()
-        self.instr.add(self.food_color)
+        add = self.instr.add
+        add(self.food_color)
         for pos in self.foods.keys():
             circle = self._circle(pos)
-            self.instr.add(circle)
+            add(circle)
             self.foods[pos] = circle
 
     def draw_food(self, event: FoodCreated) -> None:
@@ -376,9 +401,7 @@ class SnakeDrawUpdater(EventDispatcher):
         self.tail_color.rgb = value
 
     def _square(self, pos: Position) -> Rectangle:
-        x, y = self.display.pos_to_coord(pos)
-        s = self.display.square_size
-        return Rectangle(pos=(x, y), size=(s, s))
+        return Rectangle(pos=self.display.pos_to_coord(pos), size=self.display.square_dims)
 
     def _stop_animations(self) -> None:
         if self.head_animation is not None:
@@ -403,16 +426,16 @@ class SnakeDrawUpdater(EventDispatcher):
         self.tail_squares.clear()
         self.tail_pos.clear()
 
-        cells = self.snake.iter_cells()
-        self.head_pos = next(cells)
+        self.head_pos = self.snake.get_head()
 
         self.tail_color = Color(*self.tail_rgb)
-        self.instr_back.add(self.tail_color)
-        for pos in cells:
-            sqr = self._square(pos)
+        add, square = self.instr_back.add, self._square
+        add(self.tail_color)
+        for pos in self.snake.iter_body():
+            sqr = square(pos)
             self.tail_squares.appendleft(sqr)
             self.tail_pos.appendleft(pos)
-            self.instr_back.add(sqr)
+            add(sqr)
 
     def _init_animated_tail(self) -> None:
         end_tail_pos = self.tail_pos[0] if len(self.tail_pos) > 0 else self.head_pos
@@ -439,11 +462,18 @@ class SnakeDrawUpdater(EventDispatcher):
             self._init_animated_head()
 
     def _update_body(self, new_head_pos: Position, growth: int) -> None:
-        # adds a square at the current head position
+        # adds a square at the current head position, reusing the square at
+        # the end of the tail when it has to be removed anyway
         self.tail_pos.append(self.head_pos)
-        sqr = self._square(self.head_pos)
+        if growth <= 0 and len(self.tail_squares) > 0:
+            sqr = self.tail_squares.popleft()
+            self.tail_pos.popleft()
+            sqr.pos = self.display.pos_to_coord(self.head_pos)
+            growth += 1
+        else:
+            sqr = self._square(self.head_pos)
+            self.instr_back.add(sqr)
         self.tail_squares.append(sqr)
-        self.instr_back.add(sqr)
         self.head_pos = new_head_pos
 
         if growth <= 0:
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from back.agents.abstract_ai_snake_agent import AbstractAISnakeAgent
+from back.direction import UP
+from back.events import build_event_pipe
+from back.world import ManhattanDistanceHeuristic, SnakeWorld
+
+
+class StillAISnakeAgent(AbstractAISnakeAgent):
+    def update_path(self) -> None:
+        pass
+
+
+def build_world_with_snake(cells):
+    event_sender, _ = build_event_pipe()
+    world = SnakeWorld(11, 11, 0, event_sender, 0)
+    snake = StillAISnakeAgent(world, cells, UP, ManhattanDistanceHeuristic)
+    for p in cells:
+        world.incr_obstacle_count(p, 1)
+    return world, snake
+
+
+def test_shortest_path_to_adjacent_destination_without_free_neighbor():
+    # the destination is only reachable from the snake's head
+    world, snake = build_world_with_snake([(5, 3), (5, 4), (5, 5)])
+    for p in ((4, 6), (6, 6), (5, 7)):
+        world.incr_obstacle_count(p, 1)
+
+    assert snake.compute_shortest_path([(5, 6)], inf_len=0) == 0
+    assert snake.has_plan()
+    assert list(snake.inspect()) == [(5, 6)]
+
+
+def test_shortest_path_skips_enclosed_destination():
+    world, snake = build_world_with_snake([(5, 1), (5, 2), (5, 3)])
+    for p in ((4, 6), (6, 6), (5, 7), (5, 5)):
+        world.incr_obstacle_count(p, 1)
+
+    assert snake.compute_shortest_path([(5, 6)], inf_len=0) is None
+    assert not snake.has_plan()